@@ -111,4 +111,5 @@ fi
 
 # Switch to squishy user and run the application
 echo "Starting as squishy user..."
-exec su -s /bin/bash squishy -c "LIBVA_DRIVER_NAME=iHD python /app/run.py"
+# A single threaded worker: jobs and the media library are kept in process memory
+exec su -s /bin/bash squishy -c "LIBVA_DRIVER_NAME=iHD python -m gunicorn -w 1 --threads 100 -b 0.0.0.0:5101 --chdir /app squishy.wsgi:app"
@@ -1,22 +1,45 @@
 """Main Squishy application."""
 
 import os
+import re
 import logging
-from flask import Flask, redirect, url_for, request, session
+from flask import Flask, redirect, url_for, request, session, g
 from flask_socketio import SocketIO
 
-from squishy.config import load_config, Config, is_first_run
-from squishy.blueprints.api import api_bp
-from squishy.blueprints.ui import ui_bp
-from squishy.blueprints.admin import admin_bp
-from squishy.blueprints.onboarding import onboarding_bp
-from squishy import scanner
+from squishy.config import (
+    load_config,
+    Config,
+    is_first_run,
+    get_config_epoch,
+)
 
 # Initialize SocketIO globally
 socketio = SocketIO()
 
+# Blueprints that are reachable before onboarding has completed
+_FIRST_RUN_EXEMPT_BLUEPRINTS = frozenset({"api", "onboarding"})
+
+# Path prefixes exempt from the onboarding gate, for requests that match no route
+_FIRST_RUN_EXEMPT_PATH_RE = re.compile(r"^/(?:static|onboarding|api|socket\.io)(?:/|$)")
+
+def _cached_config() -> Config:
+    """Load the configuration once per request and memoize it on flask.g."""
+    if not hasattr(g, "_cfg"):
+        g._cfg = load_config()
+    return g._cfg
+
+
+def _cached_is_first_run() -> bool:
+    """Request-scoped is_first_run() built on the cached config."""
+    if not hasattr(g, "_first_run"):
+        g._first_run = is_first_run(load=_cached_config)
+    return g._first_run
+
 def perform_initial_scan(config: Config):
     """Perform initial scan of media if Jellyfin or Plex is configured."""
+    # Import here so importing the app module doesn't pull in the scanner
+    from squishy import scanner
+
     if config.jellyfin_url and config.jellyfin_api_key:
         logging.debug("Jellyfin configuration found. Starting initial scan in background...")
         scanner.scan_jellyfin_async(config.jellyfin_url, config.jellyfin_api_key)
@@ -53,14 +76,19 @@ def create_app(test_config=None):
     except OSError:
         pass
 
-    # Register blueprints
+    # Register blueprints (imported here to keep importing squishy.app lightweight)
+    from squishy.blueprints.api import api_bp
+    from squishy.blueprints.ui import ui_bp
+    from squishy.blueprints.admin import admin_bp
+    from squishy.blueprints.onboarding import onboarding_bp
+
     app.register_blueprint(api_bp, url_prefix="/api")
     app.register_blueprint(ui_bp)
     app.register_blueprint(admin_bp, url_prefix="/admin")
     app.register_blueprint(onboarding_bp, url_prefix="/onboarding")
     
     # Initialize SocketIO with the app
-    socketio.init_app(app, cors_allowed_origins="*", async_mode="eventlet")
+    socketio.init_app(app, cors_allowed_origins="*", async_mode="threading")
     
     # Import socket events after socketio initialization to avoid circular imports
     from squishy import socket_events  # noqa
@@ -68,60 +96,82 @@ def create_app(test_config=None):
     # Add a before_request handler to check if this is the first run
     @app.before_request
     def check_first_run():
-        # Skip for onboarding and static routes
-        if request.path.startswith('/static') or request.path.startswith('/onboarding'):
+        # Skip for onboarding, API and static routes (resolved by Flask's routing)
+        if request.blueprint in _FIRST_RUN_EXEMPT_BLUEPRINTS or request.endpoint == 'static':
             return None
             
-        # Skip for API routes as well
-        if request.path.startswith('/api'):
+        # Socket.io connections and unmatched paths under exempt prefixes have no endpoint
+        if request.endpoint is None and _FIRST_RUN_EXEMPT_PATH_RE.match(request.path):
             return None
             
-        # If socket.io connections, allow them
-        if request.path.startswith('/socket.io'):
+        # Sessions that already passed onboarding skip the check until the config file changes
+        config_epoch = get_config_epoch()
+        if (
+            config_epoch is not None
+            and session.get('onboarded_epoch') == config_epoch
+            and not session.get('onboarding_in_progress')
+        ):
             return None
             
         # If it's the first run or we're in an onboarding process and not already on the onboarding page, redirect
-        first_run = is_first_run()
+        first_run = _cached_is_first_run()
         onboarding_active = 'onboarding_in_progress' in session and session.get('onboarding_in_progress')
         
         # Clear onboarding flag if first_run is false but session still has the flag
         if not first_run and onboarding_active:
-            # Check if we have a valid media server configuration
-            config = load_config()
-            has_jellyfin = config.jellyfin_url and config.jellyfin_api_key
-            has_plex = config.plex_url and config.plex_token
-            
-            # If we have a valid configuration but still have the flag,
-            # clear it (configuration must have been saved manually)
-            if has_jellyfin or has_plex:
-                session.pop('onboarding_in_progress', None)
-                session.modified = True
-                onboarding_active = False
+            # A media server is configured but we still have the flag,
+            # so clear it (configuration must have been saved manually)
+            session.pop('onboarding_in_progress', None)
+            session.modified = True
+            onboarding_active = False
         
         # Redirect to onboarding if needed
-        if (first_run or onboarding_active) and not request.path.startswith('/onboarding'):
+        if first_run or onboarding_active:
             return redirect(url_for('onboarding.index'))
             
+        # Remember that this session is onboarded for the current config file
+        if config_epoch is not None:
+            session['onboarded_epoch'] = config_epoch
         return None
 
     # Perform initial scan if media server is configured and not in first run
+    # Run it as a background task so app startup doesn't wait on it
     if not test_config and not is_first_run():  # Skip scan during testing or first run
-        perform_initial_scan(config)
+        socketio.start_background_task(perform_initial_scan, config)
 
     return app
 
-def main():
-    """Run the application."""
-    # Logging is configured in run.py, but update here in case app.py is run directly
+def configure_logging():
+    """Configure logging with the level from config, overridden by LOG_LEVEL if set."""
     config = load_config()
-    log_level = os.environ.get('LOG_LEVEL', config.log_level).upper()
+    log_level = os.environ.get("LOG_LEVEL", config.log_level).upper()
+    logging.basicConfig(
+        level=getattr(logging, log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    # basicConfig is a no-op if logging was already set up, so apply the level directly
     logging.getLogger().setLevel(getattr(logging, log_level))
+
+def main():
+    """Run the application with SocketIO's development server.
+
+    This is the entry point for run.py and local development. The Docker image
+    serves squishy.wsgi:app with gunicorn instead (see entrypoint.sh).
+    """
+    configure_logging()
     
     # Create Flask app
     app = create_app()
 
-    # Run with SocketIO instead of Flask's built-in server
-    socketio.run(app, host="0.0.0.0", port=5101, debug=os.environ.get("DEBUG", "False").lower() == "true")
+    # Running this server is an explicit choice, so allow it outside a TTY
+    # (nohup, systemd, ...) as it was before gunicorn became the default
+    socketio.run(
+        app,
+        host="0.0.0.0",
+        port=5101,
+        debug=os.environ.get("DEBUG", "False").lower() == "true",
+        allow_unsafe_werkzeug=True,
+    )
 
 if __name__ == "__main__":
     main()
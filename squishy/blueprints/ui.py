@@ -1,6 +1,8 @@
 """User interface blueprint."""
 
 import os
+import logging
+from functools import lru_cache
 from flask import (
     Blueprint,
     render_template,
@@ -9,12 +11,13 @@ from flask import (
     url_for,
     flash,
     send_file,
+    send_from_directory,
 )
 
 from squishy.config import load_config
-from squishy.scanner import get_media, get_show
+from squishy.scanner import get_media, get_show, get_media_many, get_shows_many
 from squishy.transcoder import (
-    JOBS,
+    get_jobs_by_status,
     create_job,
     start_transcode,
     apply_output_path_mapping,
@@ -25,15 +28,54 @@ from squishy.completed import get_completed_transcodes, delete_transcode
 
 ui_bp = Blueprint("ui", __name__)
 
+# Configure logging
+logger = logging.getLogger(__name__)
 
-# Helper function to format file size
+
+# Display units for format_file_size, indexed by tier
+_SIZE_UNITS = (("KB", 1024), ("MB", 1024 * 1024), ("GB", 1024 * 1024 * 1024))
+
+
+# Helper function to format file size (memoized, byte counts repeat across polls)
+@lru_cache(maxsize=4096)
 def format_file_size(bytes_size):
-    if bytes_size < 1024 * 1024:  # Less than 1 MB
-        return f"{round(bytes_size / 1024, 2)} KB"
-    elif bytes_size < 1024 * 1024 * 1024:  # Less than 1 GB
-        return f"{round(bytes_size / (1024 * 1024), 2)} MB"
-    else:  # GB or larger
-        return f"{round(bytes_size / (1024 * 1024 * 1024), 2)} GB"
+    # Each tier spans 10 bits: below 2**20 is KB, below 2**30 is MB, else GB
+    tier = min(max((int(bytes_size).bit_length() - 1) // 10 - 1, 0), 2)
+    unit, divisor = _SIZE_UNITS[tier]
+    return f"{round(bytes_size / divisor, 2)} {unit}"
+
+
+def format_size_comparison(original_size_bytes, output_size_bytes):
+    """Format original and output sizes with the compression percentage."""
+    compression_pct = 100 - (output_size_bytes / original_size_bytes * 100)
+    return (
+        f"{format_file_size(original_size_bytes)} → "
+        f"{format_file_size(output_size_bytes)} ({compression_pct:.1f}% smaller)"
+    )
+
+
+def get_file_size(path):
+    """Return a file's size with a single stat call, or None if it's missing."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+# Resolved transcode directories, keyed by transcode_path and path mappings
+_REAL_TRANSCODE_PATHS = {}
+
+
+def get_real_transcode_path(config):
+    """Return the real path of the mapped transcode directory for a config."""
+    key = (config.transcode_path, tuple(sorted(config.path_mappings.items())))
+    real_transcode_path = _REAL_TRANSCODE_PATHS.get(key)
+    if real_transcode_path is None:
+        real_transcode_path = os.path.realpath(
+            apply_output_path_mapping(config.transcode_path)
+        )
+        _REAL_TRANSCODE_PATHS[key] = real_transcode_path
+    return real_transcode_path
 
 
 @ui_bp.route("/")
@@ -77,35 +119,20 @@ def show_detail(show_id):
 
     config = load_config()
 
-    # Count episodes for display and collect episode IDs for validation
-    episode_count = 0
-    episode_ids = []
-    valid_episode_ids = set()
-
-    for season in show.seasons.values():
-        for episode in season.episodes.values():
-            episode_count += 1
-            # Verify each episode exists in MEDIA dictionary
-            media_item = get_media(episode.id)
-            if not media_item:
-                print(
-                    f"WARNING: Episode {episode.id} from show {show_id} not found in MEDIA dictionary"
-                )
-            else:
-                episode_ids.append(episode.id)
-                valid_episode_ids.add(episode.id)
-
     # Log total episode count
-    print(
-        f"Show {show_id} has {episode_count} episodes, {len(episode_ids)} valid in MEDIA dictionary"
+    logger.debug(
+        "Show %s has %d episodes, %d valid in MEDIA dictionary",
+        show_id,
+        show.episode_count,
+        len(show.valid_episode_ids),
     )
 
     return render_template(
         "ui/show_detail.html",
         show=show,
         profiles=config.presets,
-        episode_count=episode_count,
-        valid_episode_ids=valid_episode_ids,
+        episode_count=show.episode_count,
+        valid_episode_ids=show.valid_episode_ids,
     )
 
 
@@ -139,91 +166,76 @@ def transcode(media_id):
         return redirect(url_for("ui.show_detail", show_id=media_item.show_id))
 
 
+def _job_display_data(job, media_item, shows):
+    """Build the template data for a job, falling back to placeholders."""
+    if not media_item:
+        return {"job": job, "media_title": "Unknown", "file_size": "N/A"}
+
+    # Get file size in a human-readable format
+    try:
+        if (
+            job.status == "completed"
+            and job.source_size_bytes
+            and job.output_size_bytes is not None
+        ):
+            # Sizes were recorded when the job finished, no I/O needed
+            file_size = format_size_comparison(
+                job.source_size_bytes, job.output_size_bytes
+            )
+        else:
+            file_size_bytes = os.stat(media_item.path).st_size
+            file_size = format_file_size(file_size_bytes)
+
+            # If job is completed and has output path, show both sizes and compression percentage
+            output_size_bytes = (
+                get_file_size(job.output_path)
+                if job.status == "completed" and job.output_path
+                else None
+            )
+            if output_size_bytes is not None and file_size_bytes > 0:
+                file_size = format_size_comparison(file_size_bytes, output_size_bytes)
+    except OSError:
+        # Handle case where file doesn't exist or can't be accessed
+        return {"job": job, "media_title": media_item.display_name, "file_size": "N/A"}
+
+    # For TV shows, include show title
+    media_title = media_item.display_name
+    if media_item.type == "episode" and media_item.show_id:
+        show = shows.get(media_item.show_id)
+        if show:
+            media_title = f"{show.title} - {media_item.display_name}"
+
+    return {"job": job, "media_title": media_title, "file_size": file_size}
+
+
 @ui_bp.route("/jobs")
 def jobs():
     """Display transcoding jobs grouped by status."""
+    active, completed, failed = get_jobs_by_status()
 
-    # Get media items for each job to display title instead of ID
-    active_jobs = []
-    completed_jobs = []
-    failed_jobs = []
-
-    for job in JOBS.values():
-        media_item = get_media(job.media_id)
-        if media_item:
-            # Get file size in a human-readable format
-            try:
-                file_size_bytes = os.path.getsize(media_item.path)
-                file_size = format_file_size(file_size_bytes)
-
-                # If job is completed and has output path, show both sizes and compression percentage
-                if (
-                    job.status == "completed"
-                    and job.output_path
-                    and os.path.exists(job.output_path)
-                ):
-                    output_size_bytes = os.path.getsize(job.output_path)
-                    output_size = format_file_size(output_size_bytes)
-
-                    # Calculate compression percentage
-                    if file_size_bytes > 0:
-                        compression_pct = 100 - (
-                            output_size_bytes / file_size_bytes * 100
-                        )
-                        file_size = f"{file_size} → {output_size} ({compression_pct:.1f}% smaller)"
-
-                # For TV shows, include show title
-                if media_item.type == "episode" and media_item.show_id:
-                    show = get_show(media_item.show_id)
-                    if show:
-                        media_title = f"{show.title} - {media_item.display_name}"
-                    else:
-                        media_title = media_item.display_name
-                else:
-                    media_title = media_item.display_name
-
-                job_data = {
-                    "job": job,
-                    "media_title": media_title,
-                    "file_size": file_size,
-                }
-
-                # Categorize job by status
-                if job.status in ["processing", "pending"]:
-                    active_jobs.append(job_data)
-                elif job.status == "completed":
-                    completed_jobs.append(job_data)
-                else:  # failed or cancelled
-                    failed_jobs.append(job_data)
-
-            except (FileNotFoundError, OSError):
-                # Handle case where file doesn't exist or can't be accessed
-                job_data = {
-                    "job": job,
-                    "media_title": media_item.display_name if media_item else "Unknown",
-                    "file_size": "N/A",
-                }
-
-                # Categorize job by status
-                if job.status in ["processing", "pending"]:
-                    active_jobs.append(job_data)
-                elif job.status == "completed":
-                    completed_jobs.append(job_data)
-                else:  # failed or cancelled
-                    failed_jobs.append(job_data)
-        else:
-            job_data = {"job": job, "media_title": "Unknown", "file_size": "N/A"}
+    # Resolve media items and shows up front so the loops only do dict lookups
+    media_items = get_media_many(
+        {job.media_id for view in (active, completed, failed) for job in view}
+    )
+    shows = get_shows_many(
+        {
+            media_item.show_id
+            for media_item in media_items.values()
+            if media_item.type == "episode" and media_item.show_id
+        }
+    )
 
-            # Categorize job by status
-            if job.status in ["processing", "pending"]:
-                active_jobs.append(job_data)
-            elif job.status == "completed":
-                completed_jobs.append(job_data)
-            else:  # failed or cancelled
-                failed_jobs.append(job_data)
+    def display(view):
+        return [
+            _job_display_data(job, media_items.get(job.media_id), shows)
+            for job in view
+        ]
 
-    # Sort active jobs to put processing ones first, then pending ones
-    active_jobs.sort(key=lambda x: 0 if x["job"].status == "processing" else 1)
+    # Processing jobs go first, then pending ones
+    active_jobs = display(job for job in active if job.status == "processing")
+    active_jobs.extend(display(job for job in active if job.status != "processing"))
+    completed_jobs = display(completed)
+    failed_jobs = display(failed)
 
     return render_template(
         "ui/jobs.html",
@@ -266,25 +278,17 @@ def completed():
     config = load_config()
     completed_transcodes = get_completed_transcodes(config.transcode_path)
 
-    # Add original file size and compression details
+    # Add original file size and compression details (sizes come from the sidecars)
     for transcode in completed_transcodes:
-        if "original_path" in transcode and os.path.exists(transcode["original_path"]):
-            # Get original file size
-            original_size_bytes = os.path.getsize(transcode["original_path"])
-            original_size = format_file_size(original_size_bytes)
-
-            # Get transcoded file size
-            output_size_bytes = os.path.getsize(transcode["file_path"])
-            output_size = format_file_size(output_size_bytes)
-
-            # Calculate compression percentage
+        original_size_bytes = transcode.get("original_size_bytes")
+        output_size_bytes = transcode.get("output_size_bytes")
+        if original_size_bytes is not None and output_size_bytes is not None:
             if original_size_bytes > 0:
-                compression_pct = 100 - (output_size_bytes / original_size_bytes * 100)
-                transcode["size_comparison"] = (
-                    f"{original_size} → {output_size} ({compression_pct:.1f}% smaller)"
+                transcode["size_comparison"] = format_size_comparison(
+                    original_size_bytes, output_size_bytes
                 )
             else:
-                transcode["size_comparison"] = output_size
+                transcode["size_comparison"] = format_file_size(output_size_bytes)
         else:
             transcode["size_comparison"] = transcode.get("output_size", "Unknown")
 
@@ -296,27 +300,26 @@ def download_file(filename):
     """Serve a file for download."""
     # Load config to get transcode path
     config = load_config()
-    transcode_path = config.transcode_path
-
-    # Apply path mappings to transcode_path
-    transcode_path = apply_output_path_mapping(transcode_path)
+    real_transcode_path = get_real_transcode_path(config)
 
-    file_path = os.path.join(transcode_path, filename)
+    file_path = os.path.join(real_transcode_path, filename)
 
     # Verify the file exists and is within transcode_path
-    if not os.path.exists(file_path) or not os.path.isfile(file_path):
+    if not os.path.isfile(file_path):
         flash("File not found")
         return redirect(url_for("ui.completed"))
 
     # Security check - make sure the file is in the transcode directory
-    real_transcode_path = os.path.realpath(transcode_path)
     real_file_path = os.path.realpath(file_path)
-    if not real_file_path.startswith(real_transcode_path):
+    if os.path.commonpath([real_transcode_path, real_file_path]) != real_transcode_path:
         flash("Invalid file path")
         return redirect(url_for("ui.completed"))
 
-    # Set download flag to trigger "Save As" dialog
-    return send_file(file_path, as_attachment=True)
+    # Set download flag to trigger "Save As" dialog; conditional responses let
+    # clients resume large transcodes with Range requests
+    return send_from_directory(
+        real_transcode_path, filename, as_attachment=True, conditional=True, etag=True
+    )
 
 
 @ui_bp.route("/download-episode/<media_id>")
@@ -342,7 +345,13 @@ def download_episode(media_id):
     filename = os.path.basename(media_item.path)
 
     # Set download flag to trigger "Save As" dialog
-    return send_file(media_item.path, as_attachment=True, download_name=filename)
+    return send_file(
+        media_item.path,
+        as_attachment=True,
+        download_name=filename,
+        conditional=True,
+        etag=True,
+    )
 
 
 @ui_bp.route("/completed/delete/<filename>", methods=["POST"])
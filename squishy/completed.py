@@ -2,28 +2,97 @@
 
 import os
 import json
-import glob
 import logging
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from squishy.transcoder import apply_output_path_mapping
 
+# Sizes for sidecars written before sizes were recorded, keyed by transcode file path.
+# A None entry means the file was missing when first checked.
+_LEGACY_SIZE_CACHE: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+
+def _list_files(directory: str) -> Dict[str, os.DirEntry]:
+    """List the regular files in a directory, by name, with a single scandir."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries if entry.is_file()}
+    except OSError:
+        return {}
+
+def _entry_size(entry: Optional[os.DirEntry]) -> Optional[int]:
+    """Return the size of a directory entry, or None if it's missing."""
+    if entry is None:
+        return None
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return None
+
+def _fill_legacy_sizes(legacy: List[Tuple[Dict[str, Any], str, os.DirEntry]]) -> None:
+    """Add sizes to sidecars written before sizes were recorded.
+
+    Original files are looked up with one scandir per parent directory, and
+    results are cached so each transcode is only checked once.
+    """
+    # Work from a local copy of the cached sizes; delete_transcode may evict
+    # entries from the shared cache while this runs
+    sizes = {}
+    uncached = []
+    for item in legacy:
+        cached = _LEGACY_SIZE_CACHE.get(item[1])
+        if cached is None:
+            uncached.append(item)
+        else:
+            sizes[item[1]] = cached
+
+    original_paths = {
+        metadata["original_path"]
+        for metadata, _, _ in uncached
+        if metadata.get("original_path")
+    }
+    files_by_parent = {
+        parent: _list_files(parent)
+        for parent in {os.path.dirname(path) for path in original_paths}
+    }
+
+    for metadata, media_path, entry in uncached:
+        original_path = metadata.get("original_path")
+        original_entry = None
+        if original_path:
+            original_entry = files_by_parent[os.path.dirname(original_path)].get(
+                os.path.basename(original_path)
+            )
+        sizes[media_path] = (_entry_size(original_entry), _entry_size(entry))
+        _LEGACY_SIZE_CACHE[media_path] = sizes[media_path]
+
+    for metadata, media_path, _ in legacy:
+        original_size_bytes, output_size_bytes = sizes[media_path]
+        metadata["original_size_bytes"] = original_size_bytes
+        metadata["output_size_bytes"] = output_size_bytes
+
 def get_completed_transcodes(transcode_path: str) -> List[Dict[str, Any]]:
     """Get all completed transcodes with metadata."""
     # Apply path mappings to transcode_path
     transcode_path = apply_output_path_mapping(transcode_path)
     
-    # Find all JSON sidecar files
-    sidecar_files = glob.glob(os.path.join(transcode_path, "*.json"))
+    # List the transcode directory once; sidecars and media files are looked up in it
+    files = _list_files(transcode_path)
 
     completed = []
-    for sidecar_path in sidecar_files:
+    legacy = []
+    for name, sidecar_entry in files.items():
+        # Only consider JSON sidecar files (skipping hidden files, like glob did)
+        if not name.endswith(".json") or name.startswith("."):
+            continue
+
+        sidecar_path = sidecar_entry.path
         try:
             # Check if the media file exists
-            media_path = sidecar_path[:-5]  # Remove .json extension
-            if not os.path.exists(media_path):
+            media_entry = files.get(name[:-5])  # Remove .json extension
+            if media_entry is None:
                 continue
+            media_path = media_entry.path
 
             # Read metadata from sidecar file
             with open(sidecar_path, "r") as f:
@@ -31,9 +100,13 @@ def get_completed_transcodes(transcode_path: str) -> List[Dict[str, Any]]:
 
             # Add file path and name
             metadata["file_path"] = media_path
-            metadata["file_name"] = os.path.basename(media_path)
+            metadata["file_name"] = media_entry.name
             metadata["sidecar_path"] = sidecar_path
 
+            # Sizes are written at completion; older sidecars are filled in below
+            if metadata.get("original_size_bytes") is None or metadata.get("output_size_bytes") is None:
+                legacy.append((metadata, media_path, media_entry))
+
             # Parse completed_at date for sorting
             if "completed_at" in metadata:
                 try:
@@ -46,6 +119,9 @@ def get_completed_transcodes(transcode_path: str) -> List[Dict[str, Any]]:
         except Exception as e:
             logging.error(f"Error reading sidecar file {sidecar_path}: {e}")
 
+    if legacy:
+        _fill_legacy_sizes(legacy)
+
     # Sort by completion date, newest first
     completed.sort(key=lambda x: x.get("completed_at_datetime", datetime.fromtimestamp(0)), reverse=True)
 
@@ -97,6 +173,9 @@ def delete_transcode(filename: str, transcode_path: str) -> Tuple[bool, str]:
         except Exception as e:
             errors.append(f"Error deleting metadata file: {str(e)}")
 
+    # Forget any cached sizes for the deleted transcode
+    _LEGACY_SIZE_CACHE.pop(file_path, None)
+
     # If neither file existed or we couldn't delete them
     if not files_deleted:
         return False, "Files not found or could not be deleted"
@@ -1,10 +1,15 @@
 """Configuration module for Squishy."""
 
+import copy
+import dataclasses
 import json
 import os
 import logging
+import secrets
+import stat
+import tempfile
 from dataclasses import dataclass
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any, Tuple
 
 
 @dataclass
@@ -39,50 +44,158 @@ class Config:
             self.enabled_libraries = {}
 
 
-def is_first_run(config_path: str = None) -> bool:
+# Parsed config keyed by (realpath, mtime) so repeated loads skip the disk read.
+# Holds (realpath, mtime_ns, config, serialized JSON of the file contents) and is
+# only ever replaced as a whole, so threads never see a half-updated entry.
+_config_cache_entry: Optional[Tuple[str, int, "Config", Optional[str]]] = None
+
+
+# Errors load_config can raise for a missing, unreadable or malformed config file
+# (e.g. invalid JSON, or valid JSON with the wrong types like presets as a list)
+CONFIG_LOAD_ERRORS = (ValueError, OSError, AttributeError, TypeError)
+
+
+def get_config_path(config_path: str = None) -> str:
+    """Get the config file path, defaulting to $CONFIG_PATH or ./config/config.json."""
+    if config_path is None:
+        config_path = os.environ.get("CONFIG_PATH", "./config/config.json")
+    return config_path
+
+
+def _stat_config(config_path: str) -> Tuple[str, Optional[int]]:
+    """Resolve a config path and get its mtime in nanoseconds (None if missing)."""
+    real_path = os.path.realpath(config_path)
+    try:
+        return real_path, os.stat(real_path).st_mtime_ns
+    except OSError:
+        return real_path, None
+
+
+def get_config_epoch(config_path: str = None) -> Optional[str]:
+    """
+    Get a token identifying the current version of the config file.
+
+    The token changes whenever the file is written, by this process or anything
+    else, so decisions derived from the config (e.g. a session having passed
+    onboarding) can be tagged with it. Returns None if the file doesn't exist.
+    """
+    config_path = get_config_path(config_path)
+
+    _, mtime = _stat_config(config_path)
+    return str(mtime) if mtime is not None else None
+
+
+def _copy_config(config: Config) -> Config:
+    """Copy a cached config so callers can modify it before saving.
+
+    Dict fields are copied shallowly (presets one level deeper, since callers
+    tweak individual presets); everything else is immutable.
+    """
+    presets = config.presets
+    if isinstance(presets, dict):
+        presets = {name: copy.copy(preset) for name, preset in presets.items()}
+    else:
+        # Malformed presets; load_config doesn't validate them, so just copy
+        presets = copy.deepcopy(presets)
+
+    return dataclasses.replace(
+        config,
+        path_mappings=copy.copy(config.path_mappings),
+        presets=presets,
+        hw_capabilities=copy.copy(config.hw_capabilities),
+        enabled_libraries=copy.copy(config.enabled_libraries),
+    )
+
+
+def has_media_server(config_data: Dict[str, Any]) -> bool:
+    """Check whether Jellyfin or Plex is configured in raw or loaded config data."""
+    has_jellyfin = config_data.get("jellyfin_url") and config_data.get("jellyfin_api_key")
+    has_plex = config_data.get("plex_url") and config_data.get("plex_token")
+    return bool(has_jellyfin or has_plex)
+
+
+def is_first_run(
+    config_path: str = None, load: Optional[Callable[[], "Config"]] = None
+) -> bool:
     """
     Determine if this is the first run of the application.
     
     A first run is considered to be when:
     1. The config file doesn't exist, or
     2. Neither Jellyfin nor Plex is configured in the config file
+
+    Args:
+        config_path: Path to the config file
+        load: Loads the Config to check (e.g. a per-request cached load_config);
+            by default the raw JSON file is read
     
     Returns:
         bool: True if this is the first run, False otherwise
     """
-    if config_path is None:
-        config_path = os.environ.get("CONFIG_PATH", "./config/config.json")
-    
+    config_path = get_config_path(config_path)
+
     # If the config file doesn't exist, this is the first run
     if not os.path.exists(config_path):
         return True
     
     # If the config file exists, check if a media server is configured
     try:
-        with open(config_path, "r") as f:
-            config_data = json.load(f)
+        if load is not None:
+            config_data = vars(load())
+        else:
+            with open(config_path, "r") as f:
+                config_data = json.load(f)
             
-        # Check if either Jellyfin or Plex is configured
-        has_jellyfin = config_data.get("jellyfin_url") and config_data.get("jellyfin_api_key")
-        has_plex = config_data.get("plex_url") and config_data.get("plex_token")
-        
-        # If neither is configured, this is still considered a first run
-        return not (has_jellyfin or has_plex)
-    except (json.JSONDecodeError, IOError):
+        # If neither Jellyfin nor Plex is configured, this is still considered a first run
+        return not has_media_server(config_data)
+    except CONFIG_LOAD_ERRORS:
         # If the file exists but can't be read or parsed, consider it a first run
         return True
 
 
 def load_config(config_path: str = None) -> Config:
     """Load configuration from a JSON file."""
-    if config_path is None:
-        config_path = os.environ.get("CONFIG_PATH", "./config/config.json")
-        
+    config_path = get_config_path(config_path)
+
+    # Serve from cache if the file hasn't changed since it was last parsed.
+    # Callers mutate the returned config before saving, so hand out a copy.
+    real_path, mtime = _stat_config(config_path)
+    entry = _config_cache_entry
+    if mtime is not None and entry is not None and entry[:2] == (real_path, mtime):
+        return _copy_config(entry[2])
+
     # Check if the config directory exists, create it if not
     config_dir = os.path.dirname(config_path)
     if not os.path.exists(config_dir):
         os.makedirs(config_dir, exist_ok=True)
 
+    if not os.path.exists(config_path):
+        config_data = None
+        serialized = None
+    else:
+        # Load configuration from file
+        with open(config_path, "r") as f:
+            config_data = json.load(f)
+        serialized = json.dumps(config_data, sort_keys=True)
+
+    config = _build_config(config_data, config_path)
+
+    if mtime is not None:
+        _store_cached_config(real_path, mtime, config, serialized)
+
+    return config
+
+
+def _store_cached_config(
+    real_path: str, mtime: int, config: Config, serialized: Optional[str]
+) -> None:
+    """Remember a parsed config and the serialized JSON it was built from."""
+    global _config_cache_entry
+    _config_cache_entry = (real_path, mtime, _copy_config(config), serialized)
+
+
+def _build_config(config_data: Optional[Dict[str, Any]], config_path: str) -> Config:
+    """Build a Config from raw JSON data, falling back to defaults if it's None."""
     # Default presets that will be used if none are defined in the config
     default_presets = {
         "high": {
@@ -127,7 +240,7 @@ def load_config(config_path: str = None) -> Config:
         "jellyfin_api_key": "",
     }
 
-    if not os.path.exists(config_path):
+    if config_data is None:
         # Log that we're using default configuration
         logging.warning(
             f"Config file not found at {config_path}, using default configuration"
@@ -135,27 +248,18 @@ def load_config(config_path: str = None) -> Config:
         logging.warning("Please configure either Jellyfin or Plex to use Squishy.")
         config_data = default_config
     else:
-        # Load configuration from file
-        with open(config_path, "r") as f:
-            config_data = json.load(f)
-
-            # Ensure presets are defined
-            if "presets" not in config_data or not config_data["presets"]:
-                logging.warning(
-                    "No presets defined in config file, using default presets"
-                )
-                config_data["presets"] = default_presets
-
-            # Ensure either Jellyfin or Plex is configured
-            has_jellyfin = config_data.get("jellyfin_url") and config_data.get(
-                "jellyfin_api_key"
+        # Ensure presets are defined
+        if "presets" not in config_data or not config_data["presets"]:
+            logging.warning(
+                "No presets defined in config file, using default presets"
             )
-            has_plex = config_data.get("plex_url") and config_data.get("plex_token")
+            config_data["presets"] = default_presets
 
-            if not has_jellyfin and not has_plex:
-                logging.warning(
-                    "No media server configured. Please configure either Jellyfin or Plex to use Squishy."
-                )
+        # Ensure either Jellyfin or Plex is configured
+        if not has_media_server(config_data):
+            logging.warning(
+                "No media server configured. Please configure either Jellyfin or Plex to use Squishy."
+            )
 
     # Handle migration from media_paths to media_path
     media_path = config_data.get("media_path")
@@ -196,16 +300,12 @@ def load_config(config_path: str = None) -> Config:
     )
 
 
-
-
 def save_config(config: Config, config_path: str = None) -> None:
     """Save configuration to a JSON file."""
-    if config_path is None:
-        config_path = os.environ.get("CONFIG_PATH", "./config/config.json")
+    config_path = get_config_path(config_path)
 
     # Generate a secret key if one doesn't exist
     if not config.secret_key:
-        import secrets
         config.secret_key = secrets.token_hex(32)
         logging.info("Generated new Flask secret key")
         
@@ -233,5 +333,43 @@ def save_config(config: Config, config_path: str = None) -> None:
         config_data["plex_url"] = config.plex_url
         config_data["plex_token"] = config.plex_token
 
-    with open(config_path, "w") as f:
-        json.dump(config_data, f, indent=2)
\ No newline at end of file
+    # Skip the write if the file already holds exactly this configuration
+    real_path = os.path.realpath(config_path)
+    serialized = json.dumps(config_data, sort_keys=True)
+    try:
+        current_stat = os.stat(real_path)
+    except OSError:
+        current_stat = None
+    mtime = current_stat.st_mtime_ns if current_stat is not None else None
+    entry = _config_cache_entry
+    if (
+        mtime is not None
+        and entry is not None
+        and entry[:2] == (real_path, mtime)
+        and entry[3] == serialized
+    ):
+        return
+
+    # Write to a temporary file next to the real file (not a symlink pointing at it)
+    # and swap it in, so a crash can't leave a truncated config behind
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(real_path),
+        prefix=os.path.basename(real_path) + ".",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            # Keep the existing permissions; the config holds API keys and tokens
+            if current_stat is not None:
+                os.fchmod(f.fileno(), stat.S_IMODE(current_stat.st_mode))
+            json.dump(config_data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, real_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    # Prime the cache with what was just written so the next load skips the parse
+    config = _build_config(copy.deepcopy(config_data), config_path)
+    _store_cached_config(real_path, os.stat(real_path).st_mtime_ns, config, serialized)
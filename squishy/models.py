@@ -1,7 +1,8 @@
 """Data models for Squishy."""
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Dict, FrozenSet, List, Optional
 
 
 @dataclass
@@ -22,7 +23,7 @@ class MediaItem:
     content_rating: Optional[str] = None
     studio: Optional[str] = None
 
-    @property
+    @cached_property
     def display_name(self) -> str:
         """Get a display name for the media item."""
         if self.year:
@@ -57,7 +58,7 @@ class Episode(MediaItem):
         """Get the media type."""
         return "episode"
     
-    @property
+    @cached_property
     def display_name(self) -> str:
         """Get a display name for the episode."""
         if self.episode_number:
@@ -102,6 +103,9 @@ class TVShow:
     rating: Optional[float] = None
     content_rating: Optional[str] = None
     studio: Optional[str] = None
+    # Computed by the scanner's index_show_episodes so views don't walk every episode
+    episode_count: int = 0
+    valid_episode_ids: FrozenSet[str] = field(default_factory=frozenset)
 
     @property
     def display_name(self) -> str:
@@ -136,6 +140,8 @@ class TranscodeJob:
     output_path: Optional[str] = None
     error_message: Optional[str] = None
     output_size: Optional[str] = None
+    source_size_bytes: Optional[int] = None  # Recorded on completion
+    output_size_bytes: Optional[int] = None  # Recorded on completion
     duration: Optional[float] = None
     current_time: Optional[float] = None
     process_id: Optional[int] = None  # Store process ID for cancellation
@@ -164,6 +170,12 @@ class TranscodeJob:
         with self._lock:
             self.output_size = size
             
+    def update_final_sizes(self, source_size_bytes: Optional[int], output_size_bytes: int):
+        """Thread-safe update of source and output sizes in bytes."""
+        with self._lock:
+            self.source_size_bytes = source_size_bytes
+            self.output_size_bytes = output_size_bytes
+            
     def update_logs(self, logs: List[str]):
         """Thread-safe update of logs."""
         with self._lock:
@@ -135,6 +135,36 @@ class MediaServerScanner(ABC):
         with TV_SHOWS_LOCK:
             TV_SHOWS[show_id] = show
 
+    def index_show_episodes(self, shows: List[TVShow]):
+        """
+        Recompute episode counts and the episode IDs present in MEDIA.
+
+        Called for each show once its episodes have been processed, so show
+        pages are usable while the rest of the scan continues.
+
+        Args:
+            shows: Shows to index
+        """
+        with MEDIA_LOCK:
+            for show in shows:
+                episode_ids = [
+                    episode.id
+                    for season in show.seasons.values()
+                    for episode in season.episodes.values()
+                ]
+                valid_episode_ids = frozenset(
+                    episode_id for episode_id in episode_ids if episode_id in MEDIA
+                )
+
+                missing_count = len(episode_ids) - len(valid_episode_ids)
+                if missing_count:
+                    logging.warning(
+                        f"{missing_count} episodes from show {show.id} not found in MEDIA dictionary"
+                    )
+
+                show.episode_count = len(episode_ids)
+                show.valid_episode_ids = valid_episode_ids
+
     def log_statistics(self):
         """Log scan statistics."""
         logging.info(f"{self.name} scan statistics: {self.stats}")
@@ -539,6 +569,9 @@ class PlexScanner(MediaServerScanner):
                         self.process_show_episodes(show_key, show)
                     )
 
+                    # Pre-compute episode data used by the show detail page
+                    self.index_show_episodes([show])
+
             except Exception as shows_json_error:
                 logging.error(f"Error parsing shows JSON: {str(shows_json_error)}")
         else:
@@ -989,10 +1022,16 @@ class JellyfinScanner(MediaServerScanner):
 
         self.stats["total_episodes_found"] = len(episode_items)
 
+        # Group episodes by series so each show can be indexed as soon as its
+        # episodes are in, rather than only at the end of the scan
+        items_by_series: Dict[str, List[Dict]] = {}
         for item in episode_items:
             if "Path" in item and "SeriesId" in item:
+                items_by_series.setdefault(item["SeriesId"], []).append(item)
+
+        for series_id, series_items in items_by_series.items():
+            for item in series_items:
                 media_id = str(uuid.uuid4())
-                series_id = item["SeriesId"]
 
                 # Apply path mapping to convert media server path to local path
                 mapped_path = apply_path_mapping(item["Path"])
@@ -1038,6 +1077,10 @@ class JellyfinScanner(MediaServerScanner):
                 episodes.append(episode)
                 self.add_episode_to_collection(episode)
 
+            # Pre-compute episode data used by the show detail page
+            if series_id in shows_by_id:
+                self.index_show_episodes([shows_by_id[series_id]])
+
         return episodes
 
     def scan(self) -> List[MediaItem]:
@@ -1135,6 +1178,14 @@ def get_media(media_id: str) -> Optional[MediaItem]:
         return MEDIA.get(media_id)
 
 
+def get_media_many(media_ids) -> Dict[str, MediaItem]:
+    """Get several media items by ID with a single lock acquisition."""
+    with MEDIA_LOCK:
+        return {
+            media_id: MEDIA[media_id] for media_id in media_ids if media_id in MEDIA
+        }
+
+
 def get_all_media() -> List[MediaItem]:
     """Get all media items."""
     with MEDIA_LOCK:
@@ -1153,6 +1204,14 @@ def get_show(show_id: str) -> Optional[TVShow]:
         return TV_SHOWS.get(show_id)
 
 
+def get_shows_many(show_ids) -> Dict[str, TVShow]:
+    """Get several TV shows by ID with a single lock acquisition."""
+    with TV_SHOWS_LOCK:
+        return {
+            show_id: TV_SHOWS[show_id] for show_id in show_ids if show_id in TV_SHOWS
+        }
+
+
 def get_shows_and_movies() -> Tuple[List[TVShow], List[MediaItem]]:
     """
     Get all TV shows and movies.
@@ -10,7 +10,7 @@ import json
 import datetime
 import signal
 import time
-from typing import Dict, Optional, List, Callable, Any
+from typing import Dict, Optional, List, Callable, Any, Tuple
 
 from squishy.config import load_config
 from squishy.models import TranscodeJob, MediaItem, Episode
@@ -27,6 +27,11 @@ logger = logging.getLogger(__name__)
 JOBS: Dict[str, TranscodeJob] = {}
 JOBS_LOCK = threading.RLock()  # Use RLock to allow re-entry from the same thread
 
+# Status-indexed views of JOBS, kept in sync by _set_job_status (guarded by JOBS_LOCK)
+JOBS_ACTIVE: Dict[str, TranscodeJob] = {}  # pending or processing
+JOBS_COMPLETED: Dict[str, TranscodeJob] = {}
+JOBS_FAILED: Dict[str, TranscodeJob] = {}  # failed or cancelled
+
 # Job queue for pending jobs
 JOB_QUEUE: List[Dict] = []
 JOB_QUEUE_LOCK = threading.RLock()
@@ -50,10 +55,60 @@ def create_job(media_item: MediaItem, preset_name: str) -> TranscodeJob:
     )
     with JOBS_LOCK:
         JOBS[job_id] = job
+        _index_job(job)
     logger.debug(f"Created job with id={job_id}")
     return job
 
 
+def _status_index(status: str) -> Dict[str, TranscodeJob]:
+    """Get the status-indexed view a job with the given status belongs in."""
+    if status in ("pending", "processing"):
+        return JOBS_ACTIVE
+    if status == "completed":
+        return JOBS_COMPLETED
+    return JOBS_FAILED
+
+
+def _unindex_job(job_id: str):
+    """Remove a job from all status-indexed views. Caller must hold JOBS_LOCK."""
+    JOBS_ACTIVE.pop(job_id, None)
+    JOBS_COMPLETED.pop(job_id, None)
+    JOBS_FAILED.pop(job_id, None)
+
+
+def _index_job(job: TranscodeJob):
+    """Place a job in the view matching its status. Caller must hold JOBS_LOCK."""
+    view = _status_index(job.status)
+    if job.id in view:
+        # Already in the right view (e.g. pending -> processing); keep its position
+        return
+    _unindex_job(job.id)
+    view[job.id] = job
+
+
+def _set_job_status(job: TranscodeJob, status: str):
+    """Update a job's status and move it to the matching status-indexed view."""
+    with JOBS_LOCK:
+        job.update_status(status)
+        if job.id in JOBS:
+            _index_job(job)
+
+
+def get_jobs_by_status() -> Tuple[List[TranscodeJob], List[TranscodeJob], List[TranscodeJob]]:
+    """
+    Get snapshots of the active, completed and failed/cancelled jobs.
+
+    Active jobs are in creation order; completed and failed jobs are in the
+    order they reached that status.
+    """
+    with JOBS_LOCK:
+        return (
+            list(JOBS_ACTIVE.values()),
+            list(JOBS_COMPLETED.values()),
+            list(JOBS_FAILED.values()),
+        )
+
+
 def get_job(job_id: str) -> Optional[TranscodeJob]:
     """Get a job by ID."""
     logger.debug(f"Getting job with id={job_id}")
@@ -64,13 +119,13 @@ def get_job(job_id: str) -> Optional[TranscodeJob]:
 def get_running_job_count():
     """Get the number of currently running jobs."""
     with JOBS_LOCK:
-        return len([j for j in JOBS.values() if j.status == "processing"])
+        return len([j for j in JOBS_ACTIVE.values() if j.status == "processing"])
 
 
 def get_pending_jobs():
     """Get a list of all pending jobs from the JOBS dictionary."""
     with JOBS_LOCK:
-        return [j for j in JOBS.values() if j.status == "pending"]
+        return [j for j in JOBS_ACTIVE.values() if j.status == "pending"]
 
 
 def process_job_queue():
@@ -293,7 +348,7 @@ def transcode(
     """Perform the transcoding using effeffmpeg."""
     try:
         # Update status with thread safety
-        job.update_status("processing")
+        _set_job_status(job, "processing")
         logger.debug(f"Job {job.id} status changed to processing")
 
         # Always use the configured transcode_path from config
@@ -486,7 +541,7 @@ def transcode(
                             job.ffmpeg_logs.extend(new_logs)
 
                 # Use process.poll() instead of wait with timeout to check if it's still running
-                # This avoids the TimeoutExpired exception when using eventlet's patched subprocess
+                # so this loop keeps streaming output instead of blocking on the process
                 if process.process.poll() is not None:
                     # Process completed
                     process.finished = True
@@ -525,7 +580,7 @@ def transcode(
                 raise RuntimeError(f"Transcode failed with code {process.returncode}")
 
             # Update job status
-            job.update_status("completed")
+            _set_job_status(job, "completed")
 
             # Update progress and output path
             with job._lock:
@@ -537,6 +592,13 @@ def transcode(
                 output_size = os.path.getsize(output_path)
                 job.update_output_size(format_file_size(output_size))
 
+                # Record sizes in bytes so the jobs view doesn't have to stat again
+                try:
+                    source_size = os.path.getsize(media_item.path)
+                except OSError:
+                    source_size = None
+                job.update_final_sizes(source_size, output_size)
+
             logger.debug(
                 f"Job {job.id} completed successfully, output: {output_path}, size: {job.output_size}"
             )
@@ -575,6 +637,8 @@ def transcode(
                 "preset_name": preset_name,
                 "completed_at": datetime.datetime.now().isoformat(),
                 "output_size": job.output_size,
+                "original_size_bytes": job.source_size_bytes,
+                "output_size_bytes": job.output_size_bytes,
                 "duration": job.duration,
             }
 
@@ -605,7 +669,7 @@ def transcode(
         logger.error(f"Transcoding job {job.id} failed: {str(e)}", exc_info=True)
 
         # Update job status with thread safety
-        job.update_status("failed")
+        _set_job_status(job, "failed")
 
         # Update error message with thread safety
         with job._lock:
@@ -851,7 +915,7 @@ def cancel_job(job_id: str) -> bool:
 
         # Update job status if found in queue
         if job_found:
-            job.update_status("cancelled")
+            _set_job_status(job, "cancelled")
             logger.info(f"Removed job {job_id} from queue")
             return True
 
@@ -861,7 +925,7 @@ def cancel_job(job_id: str) -> bool:
         return False
 
     logger.info(f"Cancelling job {job_id}")
-    job.update_status("cancelled")
+    _set_job_status(job, "cancelled")
 
     # If the job has a process ID, try to terminate it directly
     process_id = None
@@ -909,6 +973,7 @@ def remove_job(job_id: str) -> bool:
         with JOBS_LOCK:
             if job_id in JOBS:
                 del JOBS[job_id]
+                _unindex_job(job_id)
                 logger.info(f"Removed job {job_id} with status {job_status}")
                 return True
             else:
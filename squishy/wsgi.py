@@ -0,0 +1,13 @@
+"""WSGI entry point for running Squishy under a production server.
+
+Flask-SocketIO's threading mode needs a threaded server with a single worker,
+since jobs and the media library live in process memory:
+
+    python -m gunicorn -w 1 --threads 100 -b 0.0.0.0:5101 squishy.wsgi:app
+"""
+
+from squishy.app import create_app, configure_logging
+
+configure_logging()
+
+app = create_app()